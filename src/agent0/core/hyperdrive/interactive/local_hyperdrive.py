@@ -7,7 +7,7 @@ from dataclasses import asdict, dataclass
 from typing import TYPE_CHECKING
 
 import pandas as pd
-from eth_typing import BlockNumber, ChecksumAddress
+from eth_typing import ChecksumAddress
 from fixedpointmath import FixedPoint
 from web3 import Web3
 
@@ -690,8 +690,8 @@ class LocalHyperdrive(Hyperdrive):
         1. Wipe the cache from the hyperdrive interface.
         2. Load all agent's wallets from the db.
         """
-        # Set internal state block number to 0 to enusre it updates
-        self.interface.last_state_block_number = BlockNumber(0)
+        # Drop the cached pool state to ensure it updates
+        self.interface.invalidate_pool_state_cache()
 
     def _sync_events(self) -> None:
         # Making sure this function isn't called in local_hyperdrive
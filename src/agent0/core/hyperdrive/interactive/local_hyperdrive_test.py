@@ -6,6 +6,7 @@ import logging
 from datetime import timedelta
 from decimal import Decimal
 from typing import Type
+from unittest.mock import PropertyMock, patch
 
 import numpy as np
 import pandas as pd
@@ -1297,6 +1298,36 @@ def test_policy_config_none_rng(fast_chain_fixture: LocalChain):
     assert alice._active_policy.rng is not None
 
 
+# We use a function scoped chain here to avoid snapshotting since
+# we use snapshotting in the test
+@pytest.mark.anvil
+def test_load_snapshot_refreshes_pool_state(chain_fixture: LocalChain):
+    """Loading a snapshot rewinds the chain, so the cached pool state must be rebuilt."""
+    interactive_hyperdrive = LocalHyperdrive(chain_fixture, LocalHyperdrive.Config())
+    hyperdrive_interface = interactive_hyperdrive.interface
+    hyperdrive_agent = chain_fixture.init_agent(
+        base=FixedPoint(111_111), eth=FixedPoint(111), pool=interactive_hyperdrive, name="alice"
+    )
+
+    chain_fixture.save_snapshot()
+    init_pool_state = hyperdrive_interface.current_pool_state
+
+    # Move the chain forward and fill the cache with a later state
+    hyperdrive_agent.open_long(base=FixedPoint(2_222))
+    hyperdrive_agent.open_short(bonds=FixedPoint(3_333))
+    check_pool_state = hyperdrive_interface.current_pool_state
+    assert check_pool_state.block_number > init_pool_state.block_number
+    assert check_pool_state.pool_info != init_pool_state.pool_info
+
+    # The chain is now behind the cached block number, so only an explicit invalidation can refresh the state
+    chain_fixture.load_snapshot()
+    assert hyperdrive_interface.web3.eth.block_number < check_pool_state.block_number
+    loaded_pool_state = hyperdrive_interface.current_pool_state
+    assert loaded_pool_state is not check_pool_state
+    assert loaded_pool_state.block_number == hyperdrive_interface.web3.eth.block_number
+    assert loaded_pool_state.pool_info == init_pool_state.pool_info
+
+
 @pytest.mark.anvil
 def test_pool_creation_after_snapshot(chain_fixture: LocalChain):
     # pylint: disable=protected-access
@@ -1446,6 +1477,14 @@ def test_hyperdrive_read_interface_standardized_variable_rate(fast_chain_fixture
 
     assert isclose(mock_variable_rate, standardized_variable_rate, abs_tol=FixedPoint("1e-5"))
 
+    # Each access to `current_pool_state` does a freshness RPC, so the rate should read it only once
+    current_pool_state = hyperdrive_interface.current_pool_state
+    with patch.object(
+        type(hyperdrive_interface), "current_pool_state", new_callable=PropertyMock, return_value=current_pool_state
+    ) as mock_current_pool_state:
+        assert hyperdrive_interface.get_standardized_variable_rate(time_range=604800) == standardized_variable_rate
+    assert mock_current_pool_state.call_count == 1
+
 
 @pytest.mark.anvil
 @pytest.mark.parametrize("time_stretch", [0.01, 0.1, 0.5, 1, 10, 100])
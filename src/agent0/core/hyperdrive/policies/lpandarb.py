@@ -3,8 +3,7 @@
 from __future__ import annotations
 
 import logging
-from copy import deepcopy
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import TYPE_CHECKING
 
 from fixedpointmath import FixedPoint, maximum, minimum
@@ -323,7 +322,7 @@ def calc_reserves_to_hit_target_rate(
             Total amount of bonds needed to be added into the pool to hit the target rate.
     """
     predicted_rate = FixedPoint(0)
-    temp_pool_state = deepcopy(pool_state)
+    temp_pool_state = copy_pool_state_for_step(pool_state)
     iteration = 0
     total_shares_needed = FixedPoint(0)
     total_bonds_needed = FixedPoint(0)
@@ -336,9 +335,8 @@ def calc_reserves_to_hit_target_rate(
             interface, temp_pool_state, target_rate, min_trade_amount_bonds
         )
         # get the fixed rate for an updated pool state, without storing the state variable
-        # TODO: This deepcopy is slow. https://github.com/delvtech/agent0/issues/1355
         predicted_rate = interface.calc_spot_rate(
-            apply_step_to_pool_state(deepcopy(temp_pool_state), bonds_needed, shares_needed)
+            apply_step_to_pool_state(copy_pool_state_for_step(temp_pool_state), bonds_needed, shares_needed)
         )
         # adjust guess up or down based on how much the first guess overshot or undershot
         overshoot_or_undershoot = FixedPoint(0)
@@ -394,6 +392,28 @@ def apply_step_to_reserves(
     return (share_reserves, bond_reserves)
 
 
+def copy_pool_state_for_step(pool_state: PoolState) -> PoolState:
+    """Copy the pool state so that a convergence step can be applied without modifying the original.
+
+    Only the pool info is modified by a step, so the rest of the state (block, config, checkpoint)
+    is shared with the original instead of deep-copied. This relies on the rate search only ever
+    replacing the `share_reserves` and `bond_reserves` fields of the copied pool info (see
+    `apply_step_to_pool_state`). The FixedPoint values themselves are immutable, so sharing them is safe.
+    Any step that modifies other parts of the state must deep copy it instead.
+
+    Arguments
+    ---------
+    pool_state: PoolState
+        The pool state to copy.
+
+    Returns
+    -------
+    PoolState
+        A new pool state with its own copy of the pool info.
+    """
+    return replace(pool_state, pool_info=replace(pool_state.pool_info))
+
+
 def apply_step_to_pool_state(
     pool_state: PoolState,
     delta_bonds: FixedPoint,
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 import logging
+from copy import deepcopy
+from unittest.mock import patch
 
 import pytest
 from fixedpointmath import FixedPoint
 
 from agent0.core.hyperdrive.interactive import LocalChain, LocalHyperdrive
 from agent0.core.hyperdrive.interactive.local_hyperdrive_agent import LocalHyperdriveAgent
-from agent0.core.hyperdrive.policies import PolicyZoo
+from agent0.core.hyperdrive.policies import PolicyZoo, lpandarb
+from agent0.core.hyperdrive.policies.lpandarb import calc_reserves_to_hit_target_rate, copy_pool_state_for_step
 from agent0.ethpy.hyperdrive.event_types import AddLiquidity, CloseLong, CloseShort, OpenLong, OpenShort
 
 # avoid unnecessary warning from using fixtures defined in outer scope
@@ -292,6 +295,31 @@ def test_already_at_target(interactive_hyperdrive: LocalHyperdrive, arbitrage_an
     assert abs_diff < PRECISION
 
 
+@pytest.mark.anvil
+@pytest.mark.parametrize("target_rate", [0.01, 0.10])
+def test_calc_reserves_matches_deepcopy(interactive_hyperdrive: LocalHyperdrive, target_rate: float):
+    """The rate search copies only the pool info per step, which must match deep copying the whole state."""
+    interface = interactive_hyperdrive.interface
+    pool_state = interface.current_pool_state
+    original_pool_state = deepcopy(pool_state)
+    min_trade_amount_bonds = pool_state.pool_config.minimum_transaction_amount
+
+    # A step copy has its own pool info and shares the rest of the state
+    step_pool_state = copy_pool_state_for_step(pool_state)
+    assert step_pool_state == pool_state
+    assert step_pool_state.pool_info is not pool_state.pool_info
+    assert step_pool_state.pool_config is pool_state.pool_config
+
+    reserves = calc_reserves_to_hit_target_rate(interface, pool_state, FixedPoint(target_rate), min_trade_amount_bonds)
+    with patch.object(lpandarb, "copy_pool_state_for_step", side_effect=deepcopy):
+        deepcopy_reserves = calc_reserves_to_hit_target_rate(
+            interface, pool_state, FixedPoint(target_rate), min_trade_amount_bonds
+        )
+    assert reserves == deepcopy_reserves
+    # The search never modifies the state it was given
+    assert pool_state == original_pool_state
+
+
 @pytest.mark.anvil
 def test_reduce_long(interactive_hyperdrive: LocalHyperdrive, arbitrage_andy: LocalHyperdriveAgent):
     """Reduce a long position."""
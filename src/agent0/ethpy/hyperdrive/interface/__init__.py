@@ -1,4 +1,4 @@
 """High-level interface for the Hyperdrive market."""
 
-from .read_interface import HyperdriveReadInterface
+from .read_interface import HyperdriveReadInterface, clear_abi_cache
 from .read_write_interface import HyperdriveReadWriteInterface
@@ -211,10 +211,13 @@ async def _async_open_long(
     else:
         as_base_option = True
 
+    # Resolve the pool state once so the conversion and preview use the same block
+    current_pool_state = interface.current_pool_state
+
     # Convert the trade amount from steth to lido shares
     # before passing into hyperdrive
     if interface.vault_is_steth:
-        trade_amount = trade_amount / interface.current_pool_state.pool_info.vault_share_price
+        trade_amount = trade_amount / current_pool_state.pool_info.vault_share_price
         # TODO the more accurate way to do this is to use the underlying `getPooledEthByShares`
         # call to convert steth to shares, or by using
         # trade_amount.mul_div_down(getTotalPooledEther(), getTotalShares()).
@@ -235,7 +238,7 @@ async def _async_open_long(
     # To catch any solidity errors, we always preview transactions on the current block
     # before calling smart contract transact
     # Since current_pool_state.block_number is a property, we want to get the static block here
-    current_block = interface.current_pool_state.block_number
+    current_block = current_pool_state.block_number
     preview_result = {}
     if preview_before_trade or slippage_tolerance is not None:
         preview_result = smart_contract_preview_transaction(
@@ -568,10 +571,13 @@ async def _async_add_liquidity(
     else:
         as_base_option = True
 
+    # Resolve the pool state once so the conversion and preview use the same block
+    current_pool_state = interface.current_pool_state
+
     # Convert the trade amount from steth to lido shares
     # before passing into hyperdrive
     if interface.vault_is_steth:
-        trade_amount = trade_amount / interface.current_pool_state.pool_info.vault_share_price
+        trade_amount = trade_amount / current_pool_state.pool_info.vault_share_price
         # TODO the more accurate way to do this is to use the underlying `getPooledEthByShares`
         # call to convert steth to shares, or by using
         # trade_amount.mul_div_down(getTotalPooledEther(), getTotalShares()).
@@ -591,7 +597,7 @@ async def _async_add_liquidity(
     # To catch any solidity errors, we always preview transactions on the current block
     # before calling smart contract transact
     # Since current_pool_state.block_number is a property, we want to get the static block here
-    current_block = interface.current_pool_state.block_number
+    current_block = current_pool_state.block_number
     if preview_before_trade:
         _ = smart_contract_preview_transaction(
             interface.hyperdrive_contract,
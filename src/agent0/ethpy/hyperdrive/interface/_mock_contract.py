@@ -8,7 +8,7 @@ import hyperdrivepy
 from fixedpointmath import FixedPoint
 from web3.types import Timestamp
 
-from agent0.hypertypes.utilities.conversions import fixedpoint_to_pool_config, fixedpoint_to_pool_info
+from agent0.hypertypes.utilities.conversions import fixedpoint_to_pool_info
 
 if TYPE_CHECKING:
     from agent0.ethpy.hyperdrive.state import PoolState
@@ -16,10 +16,13 @@ if TYPE_CHECKING:
 # We only worry about protected access for users outside of this folder
 # pylint: disable=protected-access
 
+# Built once since FixedPoint construction validates and scales the input.
+_SECONDS_PER_YEAR = FixedPoint(60 * 60 * 24 * 365)
+
 
 def _calc_position_duration_in_years(pool_state: PoolState) -> FixedPoint:
     """See API for documentation."""
-    return FixedPoint(pool_state.pool_config.position_duration) / FixedPoint(60 * 60 * 24 * 365)
+    return FixedPoint(pool_state.pool_config.position_duration) / _SECONDS_PER_YEAR
 
 
 def _calc_time_stretch(target_rate: FixedPoint, target_position_duration: FixedPoint) -> FixedPoint:
@@ -37,7 +40,7 @@ def _calc_checkpoint_timestamp(pool_state: PoolState, time: int) -> Timestamp:
         Timestamp,
         int(
             hyperdrivepy.to_checkpoint(
-                fixedpoint_to_pool_config(pool_state.pool_config),
+                pool_state.hypertypes_pool_config,
                 fixedpoint_to_pool_info(pool_state.pool_info),
                 str(time),
             )
@@ -54,7 +57,7 @@ def _calc_checkpoint_id(checkpoint_duration: int, block_timestamp: Timestamp) ->
 def _calc_spot_rate(pool_state: PoolState) -> FixedPoint:
     """See API for documentation."""
     spot_rate = hyperdrivepy.calculate_spot_rate(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
     )
     return FixedPoint(scaled_value=int(spot_rate))
@@ -63,7 +66,7 @@ def _calc_spot_rate(pool_state: PoolState) -> FixedPoint:
 def _calc_spot_price(pool_state: PoolState):
     """See API for documentation."""
     spot_price = hyperdrivepy.calculate_spot_price(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
     )
     return FixedPoint(scaled_value=int(spot_price))
@@ -72,7 +75,7 @@ def _calc_spot_price(pool_state: PoolState):
 def _calc_max_spot_price(pool_state: PoolState):
     """See API for documentation."""
     max_spot_price = hyperdrivepy.calculate_max_spot_price(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
     )
     return FixedPoint(scaled_value=int(max_spot_price))
@@ -111,7 +114,7 @@ def _calc_bonds_given_shares_and_rate(
 def _calc_open_long(pool_state: PoolState, base_amount: FixedPoint) -> FixedPoint:
     """See API for documentation."""
     long_amount = hyperdrivepy.calculate_open_long(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(base_amount.scaled_value),
     )
@@ -123,7 +126,7 @@ def _calc_pool_deltas_after_open_long(pool_state: PoolState, base_amount: FixedP
     return FixedPoint(
         scaled_value=int(
             hyperdrivepy.calculate_pool_deltas_after_open_long(
-                fixedpoint_to_pool_config(pool_state.pool_config),
+                pool_state.hypertypes_pool_config,
                 fixedpoint_to_pool_info(pool_state.pool_info),
                 str(base_amount.scaled_value),
             )
@@ -141,7 +144,7 @@ def _calc_spot_price_after_long(
     else:
         bond_amount_str = str(bond_amount.scaled_value)
     spot_price_after_long = hyperdrivepy.calculate_spot_price_after_long(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(base_amount.scaled_value),
         bond_amount_str,
@@ -161,7 +164,7 @@ def _calc_spot_rate_after_long(
     else:
         bond_amount_str = str(bond_amount.scaled_value)
     spot_rate_after_long = hyperdrivepy.calculate_spot_rate_after_long(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(base_amount.scaled_value),
         bond_amount_str,
@@ -174,7 +177,7 @@ def _calc_max_long(pool_state: PoolState, budget: FixedPoint) -> FixedPoint:
     return FixedPoint(
         scaled_value=int(
             hyperdrivepy.calculate_max_long(
-                fixedpoint_to_pool_config(pool_state.pool_config),
+                pool_state.hypertypes_pool_config,
                 fixedpoint_to_pool_info(pool_state.pool_info),
                 str(budget.scaled_value),
                 checkpoint_exposure=str(pool_state.exposure.scaled_value),
@@ -200,7 +203,7 @@ def _calc_targeted_long(
     return FixedPoint(
         scaled_value=int(
             hyperdrivepy.calculate_targeted_long(
-                fixedpoint_to_pool_config(pool_state.pool_config),
+                pool_state.hypertypes_pool_config,
                 fixedpoint_to_pool_info(pool_state.pool_info),
                 str(budget.scaled_value),
                 str(target_rate.scaled_value),
@@ -217,7 +220,7 @@ def _calc_close_long(
 ) -> FixedPoint:
     """See API for documentation."""
     long_returns = hyperdrivepy.calculate_close_long(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(bond_amount.scaled_value),
         str(maturity_time),
@@ -238,7 +241,7 @@ def _calc_open_short(
     else:
         open_vault_share_price_str = str(open_vault_share_price.scaled_value)
     short_deposit = hyperdrivepy.calculate_open_short(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(bond_amount.scaled_value),
         open_vault_share_price_str,
@@ -250,7 +253,7 @@ def _calculate_pool_deltas_after_open_short(pool_state: PoolState, bond_amount:
     return FixedPoint(
         scaled_value=int(
             hyperdrivepy.calculate_pool_deltas_after_open_short(
-                fixedpoint_to_pool_config(pool_state.pool_config),
+                pool_state.hypertypes_pool_config,
                 fixedpoint_to_pool_info(pool_state.pool_info),
                 str(bond_amount.scaled_value),
             )
@@ -264,7 +267,7 @@ def _calc_pool_deltas_after_open_short(
 ) -> FixedPoint:
     """See API for documentation."""
     short_deposit = hyperdrivepy.calculate_pool_deltas_after_open_short(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(short_amount.scaled_value),
     )
@@ -281,7 +284,7 @@ def _calc_spot_price_after_short(
     else:
         base_amount_str = str(base_amount.scaled_value)
     spot_price = hyperdrivepy.calculate_spot_price_after_short(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(bond_amount.scaled_value),
         base_amount_str,
@@ -294,7 +297,7 @@ def _calc_max_short(pool_state: PoolState, budget: FixedPoint) -> FixedPoint:
     return FixedPoint(
         scaled_value=int(
             hyperdrivepy.calculate_max_short(
-                pool_config=fixedpoint_to_pool_config(pool_state.pool_config),
+                pool_config=pool_state.hypertypes_pool_config,
                 pool_info=fixedpoint_to_pool_info(pool_state.pool_info),
                 budget=str(budget.scaled_value),
                 open_vault_share_price=str(pool_state.pool_info.vault_share_price.scaled_value),
@@ -316,7 +319,7 @@ def _calc_close_short(
     """See API for documentation."""
     current_block_time = pool_state.block_time
     short_returns = hyperdrivepy.calculate_close_short(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(bond_amount.scaled_value),
         str(open_vault_share_price.scaled_value),
@@ -332,7 +335,7 @@ def _calc_present_value(pool_state: PoolState, current_block_timestamp: int) ->
     return FixedPoint(
         scaled_value=int(
             hyperdrivepy.calculate_present_value(
-                pool_config=fixedpoint_to_pool_config(pool_state.pool_config),
+                pool_config=pool_state.hypertypes_pool_config,
                 pool_info=fixedpoint_to_pool_info(pool_state.pool_info),
                 current_block_timestamp=str(current_block_timestamp),
             )
@@ -345,7 +348,7 @@ def _calc_solvency(pool_state: PoolState) -> FixedPoint:
     return FixedPoint(
         scaled_value=int(
             hyperdrivepy.calculate_solvency(
-                pool_config=fixedpoint_to_pool_config(pool_state.pool_config),
+                pool_config=pool_state.hypertypes_pool_config,
                 pool_info=fixedpoint_to_pool_info(pool_state.pool_info),
             )
         )
@@ -357,7 +360,7 @@ def _calc_idle_share_reserves_in_base(pool_state: PoolState) -> FixedPoint:
     return FixedPoint(
         scaled_value=int(
             hyperdrivepy.calculate_idle_share_reserves_in_base(
-                pool_config=fixedpoint_to_pool_config(pool_state.pool_config),
+                pool_config=pool_state.hypertypes_pool_config,
                 pool_info=fixedpoint_to_pool_info(pool_state.pool_info),
             )
         )
@@ -370,7 +373,7 @@ def _calc_bonds_out_given_shares_in_down(
 ) -> FixedPoint:
     """See API for documentation."""
     amount_out = hyperdrivepy.calculate_bonds_out_given_shares_in_down(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(amount_in.scaled_value),
     )
@@ -383,7 +386,7 @@ def _calc_shares_in_given_bonds_out_up(
 ) -> FixedPoint:
     """See API for documentation."""
     amount_out = hyperdrivepy.calculate_shares_in_given_bonds_out_up(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(amount_in.scaled_value),
     )
@@ -397,7 +400,7 @@ def _calc_shares_in_given_bonds_out_down(
 ) -> FixedPoint:
     """See API for documentation."""
     amount_out = hyperdrivepy.calculate_shares_in_given_bonds_out_down(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(amount_in.scaled_value),
     )
@@ -410,7 +413,7 @@ def _calc_shares_out_given_bonds_in_down(
 ) -> FixedPoint:
     """See API for documentation."""
     amount_out = hyperdrivepy.calculate_shares_out_given_bonds_in_down(
-        fixedpoint_to_pool_config(pool_state.pool_config),
+        pool_state.hypertypes_pool_config,
         fixedpoint_to_pool_info(pool_state.pool_info),
         str(amount_in.scaled_value),
     )
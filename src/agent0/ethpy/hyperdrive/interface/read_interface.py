@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, cast
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+from weakref import WeakValueDictionary
 
 from fixedpointmath import FixedPoint
+from web3.contract.contract import Contract
 from web3.exceptions import BadFunctionCallOutput, ContractLogicError
 from web3.types import BlockData, BlockIdentifier, Timestamp
 
@@ -24,6 +27,8 @@ from agent0.hypertypes import (
     IHyperdriveContract,
     MockERC4626Contract,
     MockLidoContract,
+    PoolConfigFP,
+    PoolInfoFP,
 )
 
 from ._block_getters import _get_block, _get_block_number, _get_block_time
@@ -49,6 +54,7 @@ from ._event_logs import (
     _get_transfer_single_events,
 )
 from ._mock_contract import (
+    _SECONDS_PER_YEAR,
     _calc_bonds_given_shares_and_rate,
     _calc_bonds_out_given_shares_in_down,
     _calc_checkpoint_id,
@@ -95,6 +101,50 @@ if TYPE_CHECKING:
 # We only worry about protected access for anyone outside of this folder.
 # pylint: disable=protected-access
 
+ContractT = TypeVar("ContractT", bound=Contract)
+
+# Contract factories shared across interfaces, keyed by (contract type, id of the web3 instance).
+# Values are held weakly, so a factory and the web3 instance it is bound to are released
+# once no contract built from that factory is alive.
+_contract_factories: WeakValueDictionary[tuple[type[Contract], int], type[Contract]] = WeakValueDictionary()
+
+
+def _get_contract_factory(contract_type: type[ContractT], web3: Web3) -> type[ContractT]:
+    """Build the web3 contract class for a pypechain contract type, reusing it across interfaces.
+
+    Building the factory walks the full ABI and constructs every function object, so interfaces
+    sharing a web3 instance reuse the same class. Use `clear_abi_cache` to reset.
+
+    Arguments
+    ---------
+    contract_type: type[ContractT]
+        The pypechain contract class.
+    web3: Web3
+        The web3 provider object the factory is bound to.
+
+    Returns
+    -------
+    type[ContractT]
+        The contract class bound to the web3 provider.
+    """
+    key = (contract_type, id(web3))
+    contract_factory = _contract_factories.get(key)
+    # The factory holds a reference to its web3 instance, so the id can't be reused while the entry is alive;
+    # the identity check is a guard in case that ever changes.
+    if contract_factory is None or contract_factory.w3 is not web3:
+        contract_factory = contract_type.factory(w3=web3)
+        _contract_factories[key] = contract_factory
+    return cast(type[ContractT], contract_factory)
+
+
+def clear_abi_cache() -> None:
+    """Clear the contract factories that are shared across Hyperdrive interfaces.
+
+    Interfaces constructed afterwards rebuild their contract classes from the pypechain ABIs.
+    Existing interfaces keep the contracts they were built with.
+    """
+    _contract_factories.clear()
+
 
 class HyperdriveReadInterface:
     """Read-only end-point API for interfacing with a deployed Hyperdrive pool."""
@@ -145,7 +195,7 @@ class HyperdriveReadInterface:
         self.web3 = web3
 
         # Setup Hyperdrive contract
-        self.hyperdrive_contract: IHyperdriveContract = IHyperdriveContract.factory(w3=self.web3)(
+        self.hyperdrive_contract: IHyperdriveContract = _get_contract_factory(IHyperdriveContract, self.web3)(
             web3.to_checksum_address(self.hyperdrive_address)
         )
 
@@ -167,8 +217,8 @@ class HyperdriveReadInterface:
         # the pypechain contract factory happily accepts any address and exposes
         # all functions from that contract. The code will only break if we try to
         # call a non-existent function on the underlying contract address.
-        self.vault_shares_token_contract: MockERC4626Contract | MockLidoContract = MockERC4626Contract.factory(
-            w3=self.web3
+        self.vault_shares_token_contract: MockERC4626Contract | MockLidoContract = _get_contract_factory(
+            MockERC4626Contract, self.web3
         )(address=web3.to_checksum_address(vault_shares_token_address))
 
         # Agent0 doesn't support eth as base, so if it is, we use the yield token as the base, and
@@ -189,13 +239,13 @@ class HyperdriveReadInterface:
         if self.vault_shares_token_contract.functions.symbol().call() == "stETH":
             self.vault_is_steth = True
             # Redefine the vault shares token contract as the mock lido contract
-            self.vault_shares_token_contract = MockLidoContract.factory(w3=self.web3)(
+            self.vault_shares_token_contract = _get_contract_factory(MockLidoContract, self.web3)(
                 address=web3.to_checksum_address(vault_shares_token_address)
             )
         else:
             self.vault_is_steth = False
 
-        self.base_token_contract: ERC20MintableContract = ERC20MintableContract.factory(w3=self.web3)(
+        self.base_token_contract: ERC20MintableContract = _get_contract_factory(ERC20MintableContract, self.web3)(
             web3.to_checksum_address(base_token_contract_address)
         )
 
@@ -208,6 +258,11 @@ class HyperdriveReadInterface:
         # Lazily fill in state cache
         self._current_pool_state = None
         self.last_state_block_number = -1
+        # Max trade results for the current pool state, keyed by the scaled budget,
+        # along with a copy of the pool state inputs they were computed from
+        self._max_long_cache: dict[int, FixedPoint] = {}
+        self._max_short_cache: dict[int, FixedPoint] = {}
+        self._max_trade_cache_inputs: tuple[PoolConfigFP, PoolInfoFP, FixedPoint] | None = None
 
         # Best effort to find initialize event and set deploy block
         self._deploy_block: None | int = None
@@ -240,11 +295,23 @@ class HyperdriveReadInterface:
         """The current state of the pool.
 
         Each time this is accessed we use an RPC to check that the pool state is synced with the current block.
+        The state is only rebuilt when a new block has been mined, so repeated accesses within the same block
+        reuse the same snapshot.
         """
         _ = self._ensure_current_state()
         assert self._current_pool_state is not None
         return self._current_pool_state
 
+    def invalidate_pool_state_cache(self) -> None:
+        """Drop the cached pool state so the next access to `current_pool_state` rebuilds it.
+
+        This is needed when the chain is rewound (e.g., after loading a snapshot),
+        since the cache is only refreshed when the block number increases.
+        """
+        self._current_pool_state = None
+        self.last_state_block_number = -1
+        self._clear_max_trade_cache()
+
     def _ensure_current_state(self) -> bool:
         """Update the cached pool info and latest checkpoint if needed.
 
@@ -253,14 +320,50 @@ class HyperdriveReadInterface:
         bool
             True if the state was updated.
         """
-        current_block = self.get_current_block()
-        current_block_number = self.get_block_number(current_block)
-        if current_block_number > self.last_state_block_number:
+        # Checking the block number is a much lighter RPC than fetching the full block,
+        # so an up-to-date state only costs this one call. When the state is stale, we fetch
+        # the block by this number so the state matches the block number we recorded.
+        latest_block_number = self.web3.eth.block_number
+        if latest_block_number > self.last_state_block_number or self._current_pool_state is None:
+            current_block = self.get_block(latest_block_number)
             self._current_pool_state = self.get_hyperdrive_state(current_block)
-            self.last_state_block_number = current_block_number
+            self.last_state_block_number = latest_block_number
+            self._clear_max_trade_cache()
             return True
         return False
 
+    def _clear_max_trade_cache(self) -> None:
+        """Drop the memoized max long and max short results."""
+        self._max_long_cache.clear()
+        self._max_short_cache.clear()
+        self._max_trade_cache_inputs = None
+
+    def _use_max_trade_cache(self, pool_state: PoolState) -> bool:
+        """Check if max long and max short results can be memoized for the given pool state.
+
+        Only results for the interface's current pool state are memoized, since other states are usually
+        what-if copies that the caller modifies. The current state can also be modified in place, so the
+        memoized results are dropped whenever its pool config, pool info, or exposure no longer match the
+        values the results were computed from.
+
+        Arguments
+        ---------
+        pool_state: PoolState
+            The state of the pool the max trade is calculated for.
+
+        Returns
+        -------
+        bool
+            True if the memoized results are valid for the pool state.
+        """
+        if pool_state is not self._current_pool_state:
+            return False
+        max_trade_inputs = (pool_state.pool_config, pool_state.pool_info, pool_state.exposure)
+        if self._max_trade_cache_inputs != max_trade_inputs:
+            self._clear_max_trade_cache()
+            self._max_trade_cache_inputs = deepcopy(max_trade_inputs)
+        return True
+
     def get_current_block(self) -> BlockData:
         """Use an RPC to get the current block.
 
@@ -341,7 +444,7 @@ class HyperdriveReadInterface:
             block = self.get_block(block_identifier)
         block_number = self.get_block_number(block)
         pool_info = get_hyperdrive_pool_info(self.hyperdrive_contract, block_number)
-        checkpoint_time = self.calc_checkpoint_id(self.pool_config.checkpoint_duration, self.get_block_timestamp(block))
+        checkpoint_time = _calc_checkpoint_id(self.pool_config.checkpoint_duration, _get_block_time(block))
         checkpoint = get_hyperdrive_checkpoint(self.hyperdrive_contract, checkpoint_time, block_number)
         exposure = get_hyperdrive_checkpoint_exposure(self.hyperdrive_contract, checkpoint_time, block_number)
 
@@ -494,7 +597,8 @@ class HyperdriveReadInterface:
             The standardized variable rate.
         """
         # Get the vault share price of the checkpoint in the past `time_range`
-        current_block = self.current_pool_state.block
+        current_pool_state = self.current_pool_state
+        current_block = current_pool_state.block
         current_block_time = self.get_block_timestamp(current_block)
         start_checkpoint_id = self.calc_checkpoint_id(block_timestamp=Timestamp(current_block_time - time_range))
         start_vault_share_price = self.get_checkpoint(start_checkpoint_id).vault_share_price
@@ -510,11 +614,11 @@ class HyperdriveReadInterface:
         # If the current checkpoint doesn't exist (due to checkpoint not being made yet),
         # we use the current vault share price
         if current_vault_share_price == FixedPoint(0):
-            current_vault_share_price = self.current_pool_state.pool_info.vault_share_price
+            current_vault_share_price = current_pool_state.pool_info.vault_share_price
 
         rate_of_return = (current_vault_share_price - start_vault_share_price) / start_vault_share_price
         # Annualized the rate of return
-        annualized_rate_of_return = rate_of_return * FixedPoint(60 * 60 * 24 * 365) / FixedPoint(time_range)
+        annualized_rate_of_return = rate_of_return * _SECONDS_PER_YEAR / FixedPoint(time_range)
         return annualized_rate_of_return
 
     def get_eth_base_balances(self, agent: LocalAccount) -> tuple[FixedPoint, FixedPoint]:
@@ -1113,7 +1217,13 @@ class HyperdriveReadInterface:
         """
         if pool_state is None:
             pool_state = self.current_pool_state
-        return _calc_max_long(pool_state, budget)
+        if not self._use_max_trade_cache(pool_state):
+            return _calc_max_long(pool_state, budget)
+        max_long = self._max_long_cache.get(budget.scaled_value)
+        if max_long is None:
+            max_long = _calc_max_long(pool_state, budget)
+            self._max_long_cache[budget.scaled_value] = max_long
+        return max_long
 
     def calc_close_long(
         self, bond_amount: FixedPoint, maturity_time: int, pool_state: PoolState | None = None
@@ -1268,7 +1378,13 @@ class HyperdriveReadInterface:
         """
         if pool_state is None:
             pool_state = self.current_pool_state
-        return _calc_max_short(pool_state, budget)
+        if not self._use_max_trade_cache(pool_state):
+            return _calc_max_short(pool_state, budget)
+        max_short = self._max_short_cache.get(budget.scaled_value)
+        if max_short is None:
+            max_short = _calc_max_short(pool_state, budget)
+            self._max_short_cache[budget.scaled_value] = max_short
+        return max_short
 
     def calc_close_short(
         self,
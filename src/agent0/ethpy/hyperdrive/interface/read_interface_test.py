@@ -2,25 +2,35 @@
 
 from __future__ import annotations
 
+import gc
+import weakref
 from copy import deepcopy
 from dataclasses import fields
 from datetime import datetime
 from typing import TYPE_CHECKING, cast
+from unittest.mock import patch
 
 from eth_account import Account
 from eth_account.signers.local import LocalAccount
 from fixedpointmath import FixedPoint
+from web3 import Web3
 from web3.constants import ADDRESS_ZERO
+from web3.types import RPCEndpoint
 
-from agent0.hypertypes import PoolConfig
+from agent0.hypertypes import ERC20MintableContract, IHyperdriveContract, PoolConfig
 from agent0.hypertypes.fixedpoint_types import FeesFP
 from agent0.hypertypes.utilities.conversions import pool_config_to_fixedpoint, pool_info_to_fixedpoint
 
+from . import read_interface
+from .read_interface import _get_contract_factory, clear_abi_cache
+
 if TYPE_CHECKING:
     from .read_interface import HyperdriveReadInterface
 
 # we need to use the outer name for fixtures
 # pylint: disable=redefined-outer-name
+# we test private caches on the interface
+# pylint: disable=protected-access
 
 
 class TestHyperdriveReadInterface:
@@ -57,6 +67,44 @@ class TestHyperdriveReadInterface:
         checkpoint = hyperdrive_read_interface_fixture.get_checkpoint(checkpoint_id)
         assert checkpoint == hyperdrive_read_interface_fixture.current_pool_state.checkpoint
 
+    def test_current_pool_state_cache(self, hyperdrive_read_interface_fixture: HyperdriveReadInterface):
+        """Checks that the current pool state is reused within a block and rebuilt when needed."""
+        pool_state = hyperdrive_read_interface_fixture.current_pool_state
+        assert pool_state.block_number == hyperdrive_read_interface_fixture.last_state_block_number
+        assert pool_state.block_number == hyperdrive_read_interface_fixture.web3.eth.block_number
+        # Hit: no new block was mined
+        assert hyperdrive_read_interface_fixture.current_pool_state is pool_state
+        # Invalidate: the state is rebuilt on the same block
+        hyperdrive_read_interface_fixture.invalidate_pool_state_cache()
+        rebuilt_pool_state = hyperdrive_read_interface_fixture.current_pool_state
+        assert rebuilt_pool_state is not pool_state
+        assert rebuilt_pool_state.block_number == pool_state.block_number
+        # Miss: a new block was mined
+        response = hyperdrive_read_interface_fixture.web3.provider.make_request(
+            method=RPCEndpoint("evm_mine"), params=[]
+        )
+        assert "result" in response
+        new_pool_state = hyperdrive_read_interface_fixture.current_pool_state
+        assert new_pool_state is not rebuilt_pool_state
+        assert new_pool_state.block_number == pool_state.block_number + 1
+        assert new_pool_state.block_number == hyperdrive_read_interface_fixture.last_state_block_number
+
+    def test_hyperdrive_state_checkpoint(self, hyperdrive_read_interface_fixture: HyperdriveReadInterface):
+        """Checks that building a pool state computes its checkpoint from the block without using the cached state."""
+        hyperdrive_read_interface_fixture.invalidate_pool_state_cache()
+        block = hyperdrive_read_interface_fixture.get_current_block()
+        pool_state = hyperdrive_read_interface_fixture.get_hyperdrive_state(block)
+        # Building a state must not fall back to `current_pool_state`
+        assert hyperdrive_read_interface_fixture._current_pool_state is None
+        checkpoint_id = hyperdrive_read_interface_fixture.calc_checkpoint_id(
+            checkpoint_duration=pool_state.pool_config.checkpoint_duration,
+            block_timestamp=hyperdrive_read_interface_fixture.get_block_timestamp(block),
+        )
+        assert pool_state.checkpoint_time == checkpoint_id
+        assert pool_state.checkpoint == hyperdrive_read_interface_fixture.get_checkpoint(
+            checkpoint_id, hyperdrive_read_interface_fixture.get_block_number(block)
+        )
+
     def test_spot_price_and_fixed_rate(self, hyperdrive_read_interface_fixture: HyperdriveReadInterface):
         """Checks that the Hyperdrive spot price and fixed rate match computing it by hand."""
         # get pool config variables
@@ -121,6 +169,50 @@ class TestHyperdriveReadInterface:
         _ = hyperdrive_read_interface_fixture.calc_spot_rate_after_long(FixedPoint(100))
         _ = hyperdrive_read_interface_fixture.calc_pool_deltas_after_open_long(FixedPoint(100))
 
+    def test_max_trade_cache(self, hyperdrive_read_interface_fixture: HyperdriveReadInterface):
+        """Checks that max long and max short are memoized for the current pool state only while it is unchanged."""
+        budget = FixedPoint(1_000)
+        with (
+            patch.object(read_interface, "_calc_max_long", wraps=read_interface._calc_max_long) as mock_max_long,
+            patch.object(read_interface, "_calc_max_short", wraps=read_interface._calc_max_short) as mock_max_short,
+        ):
+            pool_state = hyperdrive_read_interface_fixture.current_pool_state
+            max_long = hyperdrive_read_interface_fixture.calc_max_long(budget)
+            max_short = hyperdrive_read_interface_fixture.calc_max_short(budget)
+            assert mock_max_long.call_count == 1
+            assert mock_max_short.call_count == 1
+
+            # Hit: same state and budget
+            assert hyperdrive_read_interface_fixture.calc_max_long(budget) == max_long
+            assert hyperdrive_read_interface_fixture.calc_max_short(budget, pool_state) == max_short
+            assert mock_max_long.call_count == 1
+            assert mock_max_short.call_count == 1
+
+            # Miss: a different budget
+            _ = hyperdrive_read_interface_fixture.calc_max_long(FixedPoint(2_000))
+            assert mock_max_long.call_count == 2
+
+            # Caller-supplied states are never memoized
+            mut_pool_state = deepcopy(pool_state)
+            assert hyperdrive_read_interface_fixture.calc_max_long(budget, mut_pool_state) == max_long
+            assert mock_max_long.call_count == 3
+
+            # Modifying the current state in place drops the memoized results
+            pool_state.pool_info.share_reserves = pool_state.pool_info.share_reserves * FixedPoint(2)
+            assert hyperdrive_read_interface_fixture.calc_max_long(budget) == read_interface._calc_max_long(
+                pool_state, budget
+            )
+            assert mock_max_long.call_count == 5
+            _ = hyperdrive_read_interface_fixture.calc_max_long(budget)
+            assert mock_max_long.call_count == 5
+
+            # Invalidate: the state is rebuilt, so results are computed again
+            hyperdrive_read_interface_fixture.invalidate_pool_state_cache()
+            assert hyperdrive_read_interface_fixture.calc_max_long(budget) == max_long
+            assert hyperdrive_read_interface_fixture.calc_max_short(budget) == max_short
+            assert mock_max_long.call_count == 6
+            assert mock_max_short.call_count == 2
+
     def test_calc_short(self, hyperdrive_read_interface_fixture: HyperdriveReadInterface):
         """Test various fns associated with short trades."""
         current_time = hyperdrive_read_interface_fixture.current_pool_state.block_time
@@ -301,3 +393,39 @@ class TestHyperdriveReadInterface:
         # TODO there are rounding errors between api spot price and fixed rates
         assert abs(api_spot_price - expected_spot_price) <= FixedPoint(1e-16)
         assert abs(api_fixed_rate - expected_fixed_rate) <= FixedPoint(1e-16)
+
+
+class TestContractFactoryCache:
+    """Tests for the contract factories shared across interfaces."""
+
+    def test_factory_reused_per_web3(self):
+        """Checks that a factory is reused for the same web3 instance and contract type."""
+        web3 = Web3(Web3.HTTPProvider())
+        other_web3 = Web3(Web3.HTTPProvider())
+        hyperdrive_factory = _get_contract_factory(IHyperdriveContract, web3)
+        # Hit
+        assert _get_contract_factory(IHyperdriveContract, web3) is hyperdrive_factory
+        assert hyperdrive_factory.w3 is web3
+        # Misses on a different contract type or a different web3 instance
+        assert _get_contract_factory(ERC20MintableContract, web3) is not hyperdrive_factory
+        other_factory = _get_contract_factory(IHyperdriveContract, other_web3)
+        assert other_factory is not hyperdrive_factory
+        assert other_factory.w3 is other_web3
+
+    def test_clear_abi_cache(self):
+        """Checks that clearing the cache rebuilds the factory."""
+        web3 = Web3(Web3.HTTPProvider())
+        hyperdrive_factory = _get_contract_factory(IHyperdriveContract, web3)
+        clear_abi_cache()
+        assert _get_contract_factory(IHyperdriveContract, web3) is not hyperdrive_factory
+
+    def test_cache_does_not_keep_web3_alive(self):
+        """Checks that the cache releases the web3 instance once its contracts are gone."""
+        web3 = Web3(Web3.HTTPProvider())
+        web3_ref = weakref.ref(web3)
+        hyperdrive_factory = _get_contract_factory(IHyperdriveContract, web3)
+        factory_ref = weakref.ref(hyperdrive_factory)
+        del web3, hyperdrive_factory
+        gc.collect()
+        assert factory_ref() is None
+        assert web3_ref() is None
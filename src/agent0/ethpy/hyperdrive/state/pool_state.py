@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from copy import deepcopy
 from dataclasses import dataclass
 from typing import Any
 
 from fixedpointmath import FixedPoint
 from web3.types import BlockData
 
+from agent0.hypertypes import PoolConfig
 from agent0.hypertypes.fixedpoint_types import CheckpointFP, PoolConfigFP, PoolInfoFP
 from agent0.hypertypes.utilities.conversions import (
     dataclass_to_dict,
@@ -50,6 +52,21 @@ class PoolState:
         if block_timestamp is None:
             raise AssertionError("The provided block has no timestamp")
         self.block_time = block_timestamp
+        # Lazily filled by `hypertypes_pool_config`, along with a copy of the pool config it was converted from
+        self._hypertypes_pool_config: tuple[PoolConfigFP, PoolConfig] | None = None
+
+    @property
+    def hypertypes_pool_config(self) -> PoolConfig:
+        """The pool config with the types specified by the ABI via Pypechain.
+
+        The pool config does not change for a deployed pool, so the conversion is done once
+        and reused across calls into hyperdrivepy. It is redone if `pool_config` is replaced or modified.
+        """
+        # Compare against a copy of the converted config by value, since what-if code may modify
+        # the pool config (or a deep copy of the pool state) in place.
+        if self._hypertypes_pool_config is None or self._hypertypes_pool_config[0] != self.pool_config:
+            self._hypertypes_pool_config = (deepcopy(self.pool_config), fixedpoint_to_pool_config(self.pool_config))
+        return self._hypertypes_pool_config[1]
 
     @property
     def pool_info_to_dict(self) -> dict[str, Any]:
@@ -59,7 +76,7 @@ class PoolState:
     @property
     def pool_config_to_dict(self) -> dict[str, Any]:
         """Get the pool_config property."""
-        return dataclass_to_dict(fixedpoint_to_pool_config(self.pool_config))
+        return dataclass_to_dict(self.hypertypes_pool_config)
 
     @property
     def checkpoint_to_dict(self) -> dict[str, Any]:
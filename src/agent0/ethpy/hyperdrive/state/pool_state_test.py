@@ -0,0 +1,101 @@
+"""Tests for pool_state.py."""
+
+from __future__ import annotations
+
+from copy import deepcopy
+from dataclasses import fields
+from typing import cast
+
+from fixedpointmath import FixedPoint
+from web3.types import BlockData
+
+from agent0.hypertypes.fixedpoint_types import CheckpointFP, FeesFP, PoolConfigFP, PoolInfoFP
+from agent0.hypertypes.utilities.conversions import fixedpoint_to_pool_config
+
+from .pool_state import PoolState
+
+
+def _build_pool_state() -> PoolState:
+    pool_config = PoolConfigFP(
+        base_token="0x0000000000000000000000000000000000000001",
+        vault_shares_token="0x0000000000000000000000000000000000000002",
+        linker_factory="0x0000000000000000000000000000000000000003",
+        linker_code_hash=bytes(32),
+        initial_vault_share_price=FixedPoint(1),
+        minimum_share_reserves=FixedPoint(10),
+        minimum_transaction_amount=FixedPoint("0.001"),
+        circuit_breaker_delta=FixedPoint(2),
+        position_duration=60 * 60 * 24 * 365,
+        checkpoint_duration=3600,
+        time_stretch=FixedPoint("0.04"),
+        governance="0x0000000000000000000000000000000000000004",
+        fee_collector="0x0000000000000000000000000000000000000005",
+        sweep_collector="0x0000000000000000000000000000000000000006",
+        checkpoint_rewarder="0x0000000000000000000000000000000000000007",
+        fees=FeesFP(
+            curve=FixedPoint("0.01"),
+            flat=FixedPoint("0.0005"),
+            governance_lp=FixedPoint("0.15"),
+            governance_zombie=FixedPoint("0.03"),
+        ),
+    )
+    pool_info = PoolInfoFP(**{field.name: FixedPoint(1) for field in fields(PoolInfoFP)})
+    return PoolState(
+        block=cast(BlockData, {"number": 1, "timestamp": 1_700_000_000}),
+        pool_config=pool_config,
+        pool_info=pool_info,
+        checkpoint_time=1_699_999_200,
+        checkpoint=CheckpointFP(
+            weighted_spot_price=FixedPoint(1),
+            last_weighted_spot_price_update_time=1_699_999_200,
+            vault_share_price=FixedPoint(1),
+        ),
+        exposure=FixedPoint(0),
+        variable_rate=FixedPoint("0.05"),
+        vault_shares=FixedPoint(1),
+        total_supply_withdrawal_shares=FixedPoint(0),
+        hyperdrive_base_balance=FixedPoint(0),
+        hyperdrive_eth_balance=FixedPoint(0),
+        gov_fees_accrued=FixedPoint(0),
+    )
+
+
+class TestHypertypesPoolConfig:
+    """Tests for the cached ABI-typed pool config on PoolState."""
+
+    def test_reused(self):
+        """The converted pool config is reused while the pool config is unchanged."""
+        pool_state = _build_pool_state()
+        hypertypes_pool_config = pool_state.hypertypes_pool_config
+        assert hypertypes_pool_config == fixedpoint_to_pool_config(pool_state.pool_config)
+        assert pool_state.hypertypes_pool_config is hypertypes_pool_config
+
+    def test_pool_config_replaced(self):
+        """Replacing the pool config redoes the conversion."""
+        pool_state = _build_pool_state()
+        hypertypes_pool_config = pool_state.hypertypes_pool_config
+        pool_state.pool_config = deepcopy(pool_state.pool_config)
+        pool_state.pool_config.time_stretch = FixedPoint("0.05")
+        assert pool_state.hypertypes_pool_config is not hypertypes_pool_config
+        assert pool_state.hypertypes_pool_config.timeStretch == FixedPoint("0.05").scaled_value
+
+    def test_pool_config_modified_in_place(self):
+        """Modifying a field of the pool config in place redoes the conversion."""
+        pool_state = _build_pool_state()
+        _ = pool_state.hypertypes_pool_config
+        pool_state.pool_config.minimum_share_reserves = FixedPoint(20)
+        assert pool_state.hypertypes_pool_config == fixedpoint_to_pool_config(pool_state.pool_config)
+        # Nested fields are tracked too
+        cast(FeesFP, pool_state.pool_config.fees).curve = FixedPoint("0.02")
+        assert pool_state.hypertypes_pool_config.fees.curve == FixedPoint("0.02").scaled_value
+
+    def test_deepcopy_then_modified(self):
+        """A deep copy of the pool state does not keep returning the original conversion once modified."""
+        pool_state = _build_pool_state()
+        hypertypes_pool_config = pool_state.hypertypes_pool_config
+        copied_pool_state = deepcopy(pool_state)
+        copied_pool_state.pool_config.checkpoint_duration = 7200
+        assert copied_pool_state.hypertypes_pool_config.checkpointDuration == 7200
+        # The original is unaffected
+        assert pool_state.hypertypes_pool_config is hypertypes_pool_config
+        assert hypertypes_pool_config.checkpointDuration == 3600
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import asdict
-from typing import Any
+from typing import Any, cast
 
 from fixedpointmath import FixedPoint
 
@@ -63,8 +63,25 @@ def pool_info_to_fixedpoint(hypertypes_pool_info: PoolInfo) -> PoolInfoFP:
           - The attribute names are converted to snake_case.
           - FixedPoint types are used if the type was FixedPoint in the underlying contract.
     """
+    # Fields are mapped explicitly since this runs every time the pool state is fetched.
     return PoolInfoFP(
-        **{camel_to_snake(key): FixedPoint(scaled_value=value) for (key, value) in asdict(hypertypes_pool_info).items()}
+        share_reserves=FixedPoint(scaled_value=hypertypes_pool_info.shareReserves),
+        share_adjustment=FixedPoint(scaled_value=hypertypes_pool_info.shareAdjustment),
+        zombie_base_proceeds=FixedPoint(scaled_value=hypertypes_pool_info.zombieBaseProceeds),
+        zombie_share_reserves=FixedPoint(scaled_value=hypertypes_pool_info.zombieShareReserves),
+        bond_reserves=FixedPoint(scaled_value=hypertypes_pool_info.bondReserves),
+        lp_total_supply=FixedPoint(scaled_value=hypertypes_pool_info.lpTotalSupply),
+        vault_share_price=FixedPoint(scaled_value=hypertypes_pool_info.vaultSharePrice),
+        longs_outstanding=FixedPoint(scaled_value=hypertypes_pool_info.longsOutstanding),
+        long_average_maturity_time=FixedPoint(scaled_value=hypertypes_pool_info.longAverageMaturityTime),
+        shorts_outstanding=FixedPoint(scaled_value=hypertypes_pool_info.shortsOutstanding),
+        short_average_maturity_time=FixedPoint(scaled_value=hypertypes_pool_info.shortAverageMaturityTime),
+        withdrawal_shares_ready_to_withdraw=FixedPoint(
+            scaled_value=hypertypes_pool_info.withdrawalSharesReadyToWithdraw
+        ),
+        withdrawal_shares_proceeds=FixedPoint(scaled_value=hypertypes_pool_info.withdrawalSharesProceeds),
+        lp_share_price=FixedPoint(scaled_value=hypertypes_pool_info.lpSharePrice),
+        long_exposure=FixedPoint(scaled_value=hypertypes_pool_info.longExposure),
     )
 
 
@@ -81,8 +98,23 @@ def fixedpoint_to_pool_info(fixedpoint_pool_info: PoolInfoFP) -> PoolInfo:
     PoolInfo
         A dataclass containing the Hyperdrive pool info with derived types from Pypechain.
     """
+    # Fields are mapped explicitly since this runs on every call into hyperdrivepy.
     return PoolInfo(
-        **{snake_to_camel(key): value.scaled_value for (key, value) in asdict(fixedpoint_pool_info).items()}
+        shareReserves=fixedpoint_pool_info.share_reserves.scaled_value,
+        shareAdjustment=fixedpoint_pool_info.share_adjustment.scaled_value,
+        zombieBaseProceeds=fixedpoint_pool_info.zombie_base_proceeds.scaled_value,
+        zombieShareReserves=fixedpoint_pool_info.zombie_share_reserves.scaled_value,
+        bondReserves=fixedpoint_pool_info.bond_reserves.scaled_value,
+        lpTotalSupply=fixedpoint_pool_info.lp_total_supply.scaled_value,
+        vaultSharePrice=fixedpoint_pool_info.vault_share_price.scaled_value,
+        longsOutstanding=fixedpoint_pool_info.longs_outstanding.scaled_value,
+        longAverageMaturityTime=fixedpoint_pool_info.long_average_maturity_time.scaled_value,
+        shortsOutstanding=fixedpoint_pool_info.shorts_outstanding.scaled_value,
+        shortAverageMaturityTime=fixedpoint_pool_info.short_average_maturity_time.scaled_value,
+        withdrawalSharesReadyToWithdraw=fixedpoint_pool_info.withdrawal_shares_ready_to_withdraw.scaled_value,
+        withdrawalSharesProceeds=fixedpoint_pool_info.withdrawal_shares_proceeds.scaled_value,
+        lpSharePrice=fixedpoint_pool_info.lp_share_price.scaled_value,
+        longExposure=fixedpoint_pool_info.long_exposure.scaled_value,
     )
 
 
@@ -123,16 +155,10 @@ def fixedpoint_to_checkpoint(
     Checkpoint
         A dataclass containing the checkpoint vault_share_price and exposure fields converted to integers.
     """
-    fixedpoint_keys = [
-        "weighted_spot_price",
-        "vault_share_price",
-    ]
-
     return Checkpoint(
-        **{
-            snake_to_camel(key): value.scaled_value if key in fixedpoint_keys else value
-            for key, value in asdict(fixedpoint_checkpoint).items()
-        }
+        weightedSpotPrice=fixedpoint_checkpoint.weighted_spot_price.scaled_value,
+        lastWeightedSpotPriceUpdateTime=fixedpoint_checkpoint.last_weighted_spot_price_update_time,
+        vaultSharePrice=fixedpoint_checkpoint.vault_share_price.scaled_value,
     )
 
 
@@ -154,25 +180,30 @@ def pool_config_to_fixedpoint(
           - The attribute names are converted to snake_case.
           - FixedPoint types are used if the type was FixedPoint in the underlying contract.
     """
-    dict_pool_config = {camel_to_snake(key): value for key, value in asdict(hypertypes_pool_config).items()}
-    fixedpoint_keys = [
-        "initial_vault_share_price",
-        "minimum_share_reserves",
-        "minimum_transaction_amount",
-        "circuit_breaker_delta",
-        "time_stretch",
-    ]
-    for key in dict_pool_config:
-        if key in fixedpoint_keys:
-            dict_pool_config[key] = FixedPoint(scaled_value=dict_pool_config[key])
-        elif key == "fees":
-            dict_pool_config[key] = (
-                FixedPoint(scaled_value=dict_pool_config[key]["curve"]),
-                FixedPoint(scaled_value=dict_pool_config[key]["flat"]),
-                FixedPoint(scaled_value=dict_pool_config[key]["governanceLP"]),
-                FixedPoint(scaled_value=dict_pool_config[key]["governanceZombie"]),
-            )
-    return PoolConfigFP(**dict_pool_config)
+    fees = hypertypes_pool_config.fees
+    return PoolConfigFP(
+        base_token=hypertypes_pool_config.baseToken,
+        vault_shares_token=hypertypes_pool_config.vaultSharesToken,
+        linker_factory=hypertypes_pool_config.linkerFactory,
+        linker_code_hash=hypertypes_pool_config.linkerCodeHash,
+        initial_vault_share_price=FixedPoint(scaled_value=hypertypes_pool_config.initialVaultSharePrice),
+        minimum_share_reserves=FixedPoint(scaled_value=hypertypes_pool_config.minimumShareReserves),
+        minimum_transaction_amount=FixedPoint(scaled_value=hypertypes_pool_config.minimumTransactionAmount),
+        circuit_breaker_delta=FixedPoint(scaled_value=hypertypes_pool_config.circuitBreakerDelta),
+        position_duration=hypertypes_pool_config.positionDuration,
+        checkpoint_duration=hypertypes_pool_config.checkpointDuration,
+        time_stretch=FixedPoint(scaled_value=hypertypes_pool_config.timeStretch),
+        governance=hypertypes_pool_config.governance,
+        fee_collector=hypertypes_pool_config.feeCollector,
+        sweep_collector=hypertypes_pool_config.sweepCollector,
+        checkpoint_rewarder=hypertypes_pool_config.checkpointRewarder,
+        fees=FeesFP(
+            curve=FixedPoint(scaled_value=fees.curve),
+            flat=FixedPoint(scaled_value=fees.flat),
+            governance_lp=FixedPoint(scaled_value=fees.governanceLP),
+            governance_zombie=FixedPoint(scaled_value=fees.governanceZombie),
+        ),
+    )
 
 
 def fixedpoint_to_pool_config(
@@ -190,45 +221,29 @@ def fixedpoint_to_pool_config(
     PoolConfig
         A dataclass containing the Hyperdrive PoolConfig with types specified by the ABI via Pypechain
     """
-    dict_pool_config = {snake_to_camel(key): value for key, value in asdict(fixedpoint_pool_config).items()}
-    fixedpoint_keys = [
-        "initialVaultSharePrice",
-        "minimumShareReserves",
-        "minimumTransactionAmount",
-        "circuitBreakerDelta",
-        "timeStretch",
-    ]
-    for key in dict_pool_config:
-        if key in fixedpoint_keys:
-            dict_pool_config[key] = dict_pool_config[key].scaled_value
-        elif key == "fees":
-            dict_pool_config[key] = (
-                dict_pool_config[key]["curve"].scaled_value,
-                dict_pool_config[key]["flat"].scaled_value,
-                dict_pool_config[key]["governance_lp"].scaled_value,
-                dict_pool_config[key]["governance_zombie"].scaled_value,
-            )
+    # Fields are mapped explicitly since this runs on every call into hyperdrivepy.
+    fees = cast(FeesFP, fixedpoint_pool_config.fees)
     return PoolConfig(
-        baseToken=dict_pool_config["baseToken"],
-        vaultSharesToken=dict_pool_config["vaultSharesToken"],
-        linkerFactory=dict_pool_config["linkerFactory"],
-        linkerCodeHash=dict_pool_config["linkerCodeHash"],
-        initialVaultSharePrice=dict_pool_config["initialVaultSharePrice"],
-        minimumShareReserves=dict_pool_config["minimumShareReserves"],
-        minimumTransactionAmount=dict_pool_config["minimumTransactionAmount"],
-        circuitBreakerDelta=dict_pool_config["circuitBreakerDelta"],
-        positionDuration=dict_pool_config["positionDuration"],
-        checkpointDuration=dict_pool_config["checkpointDuration"],
-        timeStretch=dict_pool_config["timeStretch"],
-        governance=dict_pool_config["governance"],
-        feeCollector=dict_pool_config["feeCollector"],
-        sweepCollector=dict_pool_config["sweepCollector"],
-        checkpointRewarder=dict_pool_config["checkpointRewarder"],
+        baseToken=fixedpoint_pool_config.base_token,
+        vaultSharesToken=fixedpoint_pool_config.vault_shares_token,
+        linkerFactory=fixedpoint_pool_config.linker_factory,
+        linkerCodeHash=fixedpoint_pool_config.linker_code_hash,
+        initialVaultSharePrice=fixedpoint_pool_config.initial_vault_share_price.scaled_value,
+        minimumShareReserves=fixedpoint_pool_config.minimum_share_reserves.scaled_value,
+        minimumTransactionAmount=fixedpoint_pool_config.minimum_transaction_amount.scaled_value,
+        circuitBreakerDelta=fixedpoint_pool_config.circuit_breaker_delta.scaled_value,
+        positionDuration=fixedpoint_pool_config.position_duration,
+        checkpointDuration=fixedpoint_pool_config.checkpoint_duration,
+        timeStretch=fixedpoint_pool_config.time_stretch.scaled_value,
+        governance=fixedpoint_pool_config.governance,
+        feeCollector=fixedpoint_pool_config.fee_collector,
+        sweepCollector=fixedpoint_pool_config.sweep_collector,
+        checkpointRewarder=fixedpoint_pool_config.checkpoint_rewarder,
         fees=Fees(
-            curve=dict_pool_config["fees"][0],
-            flat=dict_pool_config["fees"][1],
-            governanceLP=dict_pool_config["fees"][2],
-            governanceZombie=dict_pool_config["fees"][3],
+            curve=fees.curve.scaled_value,
+            flat=fees.flat.scaled_value,
+            governanceLP=fees.governance_lp.scaled_value,
+            governanceZombie=fees.governance_zombie.scaled_value,
         ),
     )
 
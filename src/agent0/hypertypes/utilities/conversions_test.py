@@ -0,0 +1,86 @@
+"""Tests for conversions.py."""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import cast
+
+from fixedpointmath import FixedPoint
+
+from agent0.hypertypes import Checkpoint, Fees, PoolConfig, PoolInfo
+from agent0.hypertypes.fixedpoint_types import FeesFP
+
+from .conversions import (
+    camel_to_snake,
+    checkpoint_to_fixedpoint,
+    fixedpoint_to_checkpoint,
+    fixedpoint_to_pool_config,
+    fixedpoint_to_pool_info,
+    pool_config_to_fixedpoint,
+    pool_info_to_fixedpoint,
+)
+
+# Each struct field gets a distinct value so that a swapped field mapping is caught
+
+
+def test_pool_info_conversion():
+    """Every pool info field is converted to the matching snake_case FixedPoint field and back."""
+    pool_info = PoolInfo(**{field.name: (i + 1) * 10**18 for i, field in enumerate(fields(PoolInfo))})
+    fixedpoint_pool_info = pool_info_to_fixedpoint(pool_info)
+    for field in fields(PoolInfo):
+        assert getattr(fixedpoint_pool_info, camel_to_snake(field.name)) == FixedPoint(
+            scaled_value=getattr(pool_info, field.name)
+        )
+    assert fixedpoint_to_pool_info(fixedpoint_pool_info) == pool_info
+
+
+def test_checkpoint_conversion():
+    """Every checkpoint field is converted to the matching snake_case field and back."""
+    checkpoint = Checkpoint(weightedSpotPrice=10**18, lastWeightedSpotPriceUpdateTime=1_700_000_000, vaultSharePrice=2)
+    fixedpoint_checkpoint = checkpoint_to_fixedpoint(checkpoint)
+    assert fixedpoint_checkpoint.weighted_spot_price == FixedPoint(scaled_value=10**18)
+    assert fixedpoint_checkpoint.last_weighted_spot_price_update_time == 1_700_000_000
+    assert fixedpoint_checkpoint.vault_share_price == FixedPoint(scaled_value=2)
+    assert fixedpoint_to_checkpoint(fixedpoint_checkpoint) == checkpoint
+
+
+def test_pool_config_conversion():
+    """Every pool config field is converted to the matching snake_case field and back."""
+    pool_config = PoolConfig(
+        baseToken="0x0000000000000000000000000000000000000001",
+        vaultSharesToken="0x0000000000000000000000000000000000000002",
+        linkerFactory="0x0000000000000000000000000000000000000003",
+        linkerCodeHash=bytes(range(32)),
+        initialVaultSharePrice=1,
+        minimumShareReserves=2,
+        minimumTransactionAmount=3,
+        circuitBreakerDelta=4,
+        positionDuration=5,
+        checkpointDuration=6,
+        timeStretch=7,
+        governance="0x0000000000000000000000000000000000000004",
+        feeCollector="0x0000000000000000000000000000000000000005",
+        sweepCollector="0x0000000000000000000000000000000000000006",
+        checkpointRewarder="0x0000000000000000000000000000000000000007",
+        fees=Fees(curve=8, flat=9, governanceLP=10, governanceZombie=11),
+    )
+    fixedpoint_pool_config = pool_config_to_fixedpoint(pool_config)
+    fixedpoint_keys = [
+        "initialVaultSharePrice",
+        "minimumShareReserves",
+        "minimumTransactionAmount",
+        "circuitBreakerDelta",
+        "timeStretch",
+    ]
+    for field in fields(PoolConfig):
+        if field.name == "fees":
+            continue
+        value = getattr(pool_config, field.name)
+        expected_value = FixedPoint(scaled_value=value) if field.name in fixedpoint_keys else value
+        assert getattr(fixedpoint_pool_config, camel_to_snake(field.name)) == expected_value
+    fixedpoint_fees = cast(FeesFP, fixedpoint_pool_config.fees)
+    assert fixedpoint_fees.curve == FixedPoint(scaled_value=8)
+    assert fixedpoint_fees.flat == FixedPoint(scaled_value=9)
+    assert fixedpoint_fees.governance_lp == FixedPoint(scaled_value=10)
+    assert fixedpoint_fees.governance_zombie == FixedPoint(scaled_value=11)
+    assert fixedpoint_to_pool_config(fixedpoint_pool_config) == pool_config